@@ -4,19 +4,80 @@ Database connection helpers for the Library Management System.
 
 This module connects to the MySQL database defined in schema/schema.sql.
 Connection parameters are loaded from environment variables via config.py.
+
+Connections come from a small module-level pool, so service calls reuse an
+already-authenticated session instead of opening a new TCP connection (and
+doing a full MySQL handshake) every time.
 """
 
+import threading
+import time
 from contextlib import contextmanager
-from typing import Iterator
+from typing import Any, Iterator, Optional, Tuple
 
-import mysql.connector
-from mysql.connector import MySQLConnection
+from mysql.connector.errors import Error, PoolError
+from mysql.connector.pooling import MySQLConnectionPool, PooledMySQLConnection
 import config
 
 
-def get_connection() -> MySQLConnection:
+POOL_NAME = "lib"
+POOL_SIZE = 8
+
+# How long get_connection() waits for a free pooled connection (seconds)
+# before giving up, and how often it checks while waiting.
+POOL_TIMEOUT = 10.0
+_POOL_POLL_INTERVAL = 0.005
+
+# Rows pulled per fetchmany() call by iter_rows().
+FETCH_BATCH_SIZE = 500
+
+_POOL: Optional[MySQLConnectionPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pool() -> MySQLConnectionPool:
     """
-    Return a connection to the MySQL 'library' database.
+    Return the shared connection pool, creating it on first use.
+
+    The pool is built lazily so that importing the backend does not require
+    a running database (the pool opens all of its connections up front).
+
+    pool_reset_session=False skips the COM_RESET_CONNECTION round trip when a
+    connection is handed back; _release() ends any open transaction itself.
+
+    autocommit=True means a plain read does not leave an implicit
+    transaction open behind it (which would then need a ROLLBACK before the
+    connection could be reused). Writes that must be atomic go through
+    transaction() or get_cursor(commit=True), which start one explicitly.
+
+    use_pure=False asks for the C extension, which decodes result sets in C
+    rather than in the pure-Python protocol implementation.
+
+    The lock keeps concurrent first callers (threaded Flask, the parallel
+    smoke tests) from each building a pool.
+    """
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = MySQLConnectionPool(
+                    pool_name=POOL_NAME,
+                    pool_size=POOL_SIZE,
+                    pool_reset_session=False,
+                    autocommit=True,
+                    host=config.DB_HOST,
+                    port=config.DB_PORT,
+                    user=config.DB_USER,
+                    password=config.DB_PASSWORD,
+                    database=config.DB_NAME,
+                    use_pure=False,
+                )
+    return _POOL
+
+
+def get_connection() -> PooledMySQLConnection:
+    """
+    Return a pooled connection to the MySQL 'library' database.
 
     Uses the values defined in .env and loaded by config.py:
       - DB_HOST
@@ -24,20 +85,65 @@ def get_connection() -> MySQLConnection:
       - DB_USER
       - DB_PASSWORD
       - DB_NAME
+
+    Calling close() on the returned connection gives it back to the pool.
+
+    The pool itself fails at once when all POOL_SIZE connections are checked
+    out, so this waits up to POOL_TIMEOUT seconds for one to be returned
+    (threaded Flask can have more requests in flight than the pool has
+    connections). Raises PoolError if none frees up in time.
+    """
+    pool = _get_pool()
+    deadline = None
+    while True:
+        try:
+            return pool.get_connection()
+        except PoolError:
+            now = time.monotonic()
+            if deadline is None:
+                deadline = now + POOL_TIMEOUT
+            elif now >= deadline:
+                raise
+            time.sleep(_POOL_POLL_INTERVAL)
+
+
+def _release(conn: PooledMySQLConnection, cur, failed: bool = False) -> None:
     """
-    return mysql.connector.connect(
-        host=config.DB_HOST,
-        port=config.DB_PORT,
-        user=config.DB_USER,
-        password=config.DB_PASSWORD,
-        database=config.DB_NAME,
-    )
+    Close the cursor and hand the connection back to the pool.
+
+    failed is True when the block using the cursor raised.
+    """
+    try:
+        if cur is not None:
+            cur.close()
+        # Sessions are not reset when returned to the pool, so make sure the
+        # next borrower does not inherit an open transaction (or its locks).
+        # With autocommit on, that only happens when a transaction() or
+        # get_cursor(commit=True) block raised before committing.
+        if conn.in_transaction:
+            conn.rollback()
+    except Error:
+        # The session is in an unknown state (unread rows, broken link).
+        # Disconnect it so the pool reconnects it on the next checkout, and
+        # let the block's own exception, if any, be the one reported.
+        try:
+            conn.disconnect()
+        except Error:
+            pass
+        if not failed:
+            raise
+    finally:
+        conn.close()
 
 
 @contextmanager
-def get_cursor(commit: bool = False, dictionary: bool = True) -> Iterator:
+def get_cursor(
+    commit: bool = False,
+    dictionary: bool = True,
+    buffered: bool = False,
+) -> Iterator:
     """
-    Context manager that yields a cursor and ensures the connection is closed.
+    Context manager that yields a cursor and returns the connection to the pool.
 
     Example:
         from backend.db import get_cursor
@@ -47,34 +153,80 @@ def get_cursor(commit: bool = False, dictionary: bool = True) -> Iterator:
             (count,) = cur.fetchone()
 
     Args:
-        commit: if True, commit the transaction when the block exits.
+        commit: if True, run the block in a transaction that is committed
+            when it exits normally (otherwise each statement autocommits).
         dictionary: if True, returns rows as dicts (column_name -> value).
+        buffered: if True, read the whole result set into client memory as
+            soon as the query runs. The default (unbuffered) streams rows
+            from the server as they are fetched.
 
     Yields:
         A MySQL cursor object.
     """
     conn = get_connection()
+    cur = None
+    failed = False
     try:
-        cur = conn.cursor(dictionary=dictionary)
+        if commit:
+            conn.start_transaction()
+        cur = conn.cursor(dictionary=dictionary, buffered=buffered)
         yield cur
         if commit:
             conn.commit()
+    except BaseException:
+        failed = True
+        raise
     finally:
-        cur.close()
-        conn.close()
+        _release(conn, cur, failed)
 
 
-def setup_database() -> None:
+@contextmanager
+def transaction(dictionary: bool = True) -> Iterator[Tuple[PooledMySQLConnection, Any]]:
     """
-    Placeholder for compatibility with earlier SQLite-based design.
+    Context manager for a multi-statement operation on one connection.
+
+    Every statement runs on the same cursor inside a single transaction,
+    which is committed once when the block exits normally and rolled back
+    if it raises.
 
-    In this project, the schema is managed via:
-      - schema/schema.sql
-      - schema/reset.sql
+    Example:
+        from backend.db import transaction
+
+        with transaction() as (conn, cur):
+            cur.execute("UPDATE BOOK_LOANS SET Date_in = CURDATE() WHERE Loan_id = %s", (1,))
+            cur.execute("SELECT Date_in FROM BOOK_LOANS WHERE Loan_id = %s", (1,))
+
+    Args:
+        dictionary: if True, returns rows as dicts (column_name -> value).
 
-    So this function does not create tables. It simply checks that we can
-    connect to the database; callers can log or handle errors as needed.
+    Yields:
+        A (connection, cursor) pair.
     """
-    # Simple connectivity check
     conn = get_connection()
-    conn.close()
+    cur = None
+    failed = False
+    try:
+        conn.start_transaction()
+        cur = conn.cursor(dictionary=dictionary)
+        yield conn, cur
+        conn.commit()
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        _release(conn, cur, failed=failed)
+
+
+def iter_rows(cur, batch_size: int = FETCH_BATCH_SIZE) -> Iterator:
+    """
+    Yield the rows of an executed cursor, fetching batch_size rows at a time.
+
+    Used instead of fetchall() so large result sets are never held in client
+    memory twice (raw rows plus the converted results built from them).
+    """
+    while True:
+        batch = cur.fetchmany(batch_size)
+        if not batch:
+            return
+        yield from batch
+
@@ -21,113 +21,186 @@ Key operations:
     - checkin_book()
     - get_borrower_loans()
     - get_borrower_fines()
+    - get_borrower_dashboard()
     - pay_fine()
 """
 
 from __future__ import annotations
 
-from dataclasses import asdict
+import json
+import re
 from typing import Any, Dict, List, Optional, Tuple
 
-from .db import get_cursor
+from mysql.connector import errorcode
+from mysql.connector.errors import DatabaseError
+
+from .db import get_cursor, iter_rows, transaction
 from . import utils
-from .models import BookLoan, Fine, Borrower
+from .models import Borrower
 
 
 # ---------------------------------------------------------------------------
 # Helper queries
 # ---------------------------------------------------------------------------
 
-def _book_is_available(isbn: str) -> bool:
+def _checkout_preflight(cur, isbn: str, card_id: str) -> Tuple[bool, int, bool]:
     """
-    Return True if the book has no active (unreturned) loans.
+    Fetch everything checkout_book() checks, in one query on an open cursor.
+
+    Only needed to explain why a conditional checkout inserted nothing.
+
+    Returns (borrower_exists, active_loan_count, book_available).
     """
-    with get_cursor() as cur:
-        cur.execute(
-            """
-            SELECT COUNT(*) AS n
-            FROM BOOK_LOANS
-            WHERE Isbn = %s AND Date_in IS NULL
-            """,
-            (isbn,),
-        )
-        row = cur.fetchone()
-    return (row or {}).get("n", 0) == 0
+    cur.execute(
+        """
+        SELECT
+            EXISTS (
+                SELECT 1 FROM BORROWER WHERE Card_id = %s
+            ) AS borrower_exists,
+            (
+                SELECT COUNT(*)
+                FROM BOOK_LOANS
+                WHERE Card_id = %s AND Date_in IS NULL
+            ) AS active_loans,
+            NOT EXISTS (
+                SELECT 1
+                FROM BOOK_LOANS
+                WHERE Isbn = %s AND Date_in IS NULL
+            ) AS book_available
+        """,
+        (card_id, card_id, isbn),
+    )
+    borrower_exists, active_loans, book_available = cur.fetchone()
+    return bool(borrower_exists), int(active_loans), bool(book_available)
+
 
+# ---------------------------------------------------------------------------
+# Public: Searching
+# ---------------------------------------------------------------------------
 
-def _borrower_active_loan_count(card_id: str) -> int:
+def _search_books_sql(title_match: str, name_match: str) -> str:
     """
-    Return the number of active loans for the given borrower.
+    Build the search query around the given title / author-name conditions.
+
+    Matching ISBNs are collected with a UNION so each branch can use its own
+    index (MySQL will not use a FULLTEXT index under an OR across tables),
+    then the authors and availability are gathered for those books only.
     """
-    with get_cursor() as cur:
-        cur.execute(
-            """
-            SELECT COUNT(*) AS n
-            FROM BOOK_LOANS
-            WHERE Card_id = %s AND Date_in IS NULL
-            """,
-            (card_id,),
-        )
-        row = cur.fetchone()
-    return int((row or {}).get("n", 0))
+    return f"""
+    SELECT
+        b.Isbn,
+        b.Title,
+        JSON_ARRAYAGG(a.Name) AS Authors,
+        NOT EXISTS (
+            SELECT 1
+            FROM BOOK_LOANS l
+            WHERE l.Isbn = b.Isbn AND l.Date_in IS NULL
+        ) AS Available
+    FROM (
+        SELECT Isbn FROM BOOK WHERE {title_match}
+        UNION
+        SELECT ba.Isbn
+        FROM BOOK_AUTHORS ba
+        JOIN AUTHORS a ON a.Author_id = ba.Author_id
+        WHERE {name_match}
+        UNION
+        SELECT Isbn FROM BOOK WHERE Isbn = %s
+    ) AS hit
+    JOIN BOOK b ON b.Isbn = hit.Isbn
+    LEFT JOIN BOOK_AUTHORS ba ON ba.Isbn = b.Isbn
+    LEFT JOIN AUTHORS a ON a.Author_id = ba.Author_id
+    GROUP BY b.Isbn, b.Title
+    ORDER BY b.Title ASC
+    LIMIT 50
+"""
 
 
-def _borrower_exists(card_id: str) -> bool:
-    with get_cursor() as cur:
-        cur.execute(
-            "SELECT 1 FROM BORROWER WHERE Card_id = %s",
-            (card_id,),
-        )
-        row = cur.fetchone()
-    return row is not None
+_SEARCH_BOOKS_FULLTEXT_SQL = _search_books_sql(
+    "MATCH (Title) AGAINST (%s IN BOOLEAN MODE)",
+    "MATCH (a.Name) AGAINST (%s IN BOOLEAN MODE)",
+)
 
+# Fallback for queries with no word the FULLTEXT index can match.
+_SEARCH_BOOKS_LIKE_SQL = _search_books_sql("Title LIKE %s", "a.Name LIKE %s")
+
+# Matches InnoDB's default innodb_ft_min_token_size; shorter words are not
+# indexed, so requiring them would match nothing.
+FULLTEXT_MIN_WORD_LEN = 3
+
+# InnoDB's default stopword list (INFORMATION_SCHEMA.INNODB_FT_DEFAULT_STOPWORD).
+# Stopwords are never indexed, so "+the*" would only match other words that
+# start with "the" and "the hobbit" would miss "The Hobbit".
+FULLTEXT_STOPWORDS = frozenset({
+    "a", "about", "an", "are", "as", "at", "be", "by", "com", "de", "en",
+    "for", "from", "how", "i", "in", "is", "it", "la", "of", "on", "or",
+    "that", "the", "this", "to", "was", "what", "when", "where", "who",
+    "will", "with", "und", "www",
+})
+
+
+def _fulltext_terms(query: str) -> str:
+    """
+    Turn a free-text query into a BOOLEAN MODE search string.
+
+    Every indexable word is required and prefix-matched ("harry pot" ->
+    "+harry* +pot*"); short words and stopwords are dropped. Only word
+    characters are kept, so user input cannot inject boolean operators.
+    Returns '' if no word is indexable.
+    """
+    words = re.findall(r"\w+", query)
+    return " ".join(
+        f"+{w}*"
+        for w in words
+        if len(w) >= FULLTEXT_MIN_WORD_LEN and w.lower() not in FULLTEXT_STOPWORDS
+    )
 
-# ---------------------------------------------------------------------------
-# Public: Searching
-# ---------------------------------------------------------------------------
 
 def search_books(query: str) -> List[Dict[str, Any]]:
     """
     Search books by title, author name, or ISBN.
 
+    Title and author words are matched through the FULLTEXT indexes (every
+    word required, prefix match); queries with no indexable word fall back
+    to a substring LIKE. An exact ISBN always matches.
+
     Returns a list of dictionaries with:
         - book: Book model as dict
         - authors: list of author names
         - available: bool
     """
-    like = f"%{query}%"
+    terms = _fulltext_terms(query)
+    if terms:
+        sql, params = _SEARCH_BOOKS_FULLTEXT_SQL, (terms, terms, query)
+    else:
+        like = f"%{query}%"
+        sql, params = _SEARCH_BOOKS_LIKE_SQL, (like, like, query)
 
     with get_cursor() as cur:
-        cur.execute(
-            """
-            SELECT
-                b.Isbn,
-                b.Title,
-                GROUP_CONCAT(a.Name SEPARATOR ', ') AS Authors
-            FROM BOOK b
-            LEFT JOIN BOOK_AUTHORS ba ON ba.Isbn = b.Isbn
-            LEFT JOIN AUTHORS a ON a.Author_id = ba.Author_id
-            WHERE b.Title LIKE %s
-               OR a.Name LIKE %s
-               OR b.Isbn = %s
-            GROUP BY b.Isbn, b.Title
-            ORDER BY b.Title ASC
-            LIMIT 50
-            """,
-            (like, like, query),
-        )
+        cur.execute(sql, params)
+        # Capped by LIMIT 50, so fetching it in one go is fine.
         rows = cur.fetchall()
 
+    books = utils.convert_rows(rows, "book")
+
+    # Per-row helpers as locals, so the loop does not look them up each time.
+    to_dict = utils.model_to_dict
+    loads = json.loads
+
     results: List[Dict[str, Any]] = []
-    for row in rows:
-        book = utils.row_to_book(row)
-        authors_str = row.get("Authors") or ""
-        authors = [name.strip() for name in authors_str.split(",") if name.strip()]
-        available = _book_is_available(book.isbn)
+    for row, book in zip(rows, books):
+        # JSON keeps names that contain commas intact; a book with no authors
+        # comes back as [null] from the LEFT JOIN.
+        authors_json = row.get("Authors")
+        authors = (
+            [name for name in loads(authors_json) if name is not None]
+            if authors_json
+            else []
+        )
+        available = bool(row["Available"])
 
         results.append(
             {
-                "book": asdict(book),
+                "book": to_dict(book),
                 "authors": authors,
                 "available": available,
             }
@@ -144,6 +217,45 @@ MAX_ACTIVE_LOANS_PER_BORROWER = 3
 LOAN_DAYS = 14
 FINE_RATE_PER_DAY = 0.25  # dollars per overdue day
 
+# The constants above are baked into the SQL text once at import, so every
+# call sends identical statement text and binds only per-call values.
+# int()/float() guarantee only numeric literals end up in the SQL.
+
+_CHECKOUT_SQL = f"""
+    INSERT INTO BOOK_LOANS (Isbn, Card_id, Date_out, Due_date, Date_in)
+    SELECT %s, %s, CURDATE(), DATE_ADD(CURDATE(), INTERVAL {int(LOAN_DAYS)} DAY), NULL
+    FROM DUAL
+    WHERE EXISTS (
+            SELECT 1 FROM BORROWER WHERE Card_id = %s
+        )
+      AND (
+            -- Only whether the cap is reached matters here, so stop
+            -- counting once it is.
+            SELECT COUNT(*)
+            FROM (
+                SELECT 1
+                FROM BOOK_LOANS
+                WHERE Card_id = %s AND Date_in IS NULL
+                LIMIT {int(MAX_ACTIVE_LOANS_PER_BORROWER)}
+            ) AS active
+        ) < {int(MAX_ACTIVE_LOANS_PER_BORROWER)}
+      AND NOT EXISTS (
+            SELECT 1
+            FROM BOOK_LOANS
+            WHERE Isbn = %s AND Date_in IS NULL
+        )
+"""
+
+_FINE_SQL = f"""
+    INSERT INTO FINES (Loan_id, Fine_amt, Paid)
+    SELECT Loan_id, DATEDIFF(Date_in, Due_date) * {float(FINE_RATE_PER_DAY)}, 0
+    FROM BOOK_LOANS
+    WHERE Loan_id = %s AND DATEDIFF(Date_in, Due_date) > 0
+    ON DUPLICATE KEY UPDATE
+        Fine_amt = VALUES(Fine_amt),
+        Paid = 0
+"""
+
 
 def checkout_book(isbn: str, card_id: str) -> Tuple[bool, str]:
     """
@@ -161,25 +273,32 @@ def checkout_book(isbn: str, card_id: str) -> Tuple[bool, str]:
 
     Returns (success, message).
     """
-    if not _borrower_exists(card_id):
-        return False, f"Borrower with Card_id {card_id} does not exist."
-
-    active_loans = _borrower_active_loan_count(card_id)
-    if active_loans >= MAX_ACTIVE_LOANS_PER_BORROWER:
-        return False, f"Borrower already has {active_loans} active loans."
-
-    if not _book_is_available(isbn):
-        return False, f"Book {isbn} is currently checked out."
-
-    # Perform checkout
-    with get_cursor(commit=True) as cur:
-        cur.execute(
-            """
-            INSERT INTO BOOK_LOANS (Isbn, Card_id, Date_out, Due_date, Date_in)
-            VALUES (%s, %s, CURDATE(), DATE_ADD(CURDATE(), INTERVAL %s DAY), NULL)
-            """,
-            (isbn, card_id, LOAN_DAYS),
-        )
+    # The rules are checked by the INSERT itself, so the checkout is a single
+    # statement, atomic on its own under autocommit: one round trip, no
+    # START TRANSACTION/COMMIT. Two concurrent checkouts of the same book can
+    # still collide on InnoDB's gap locks for the active-loan range; the
+    # server then picks one as a deadlock victim and rolls it back.
+    retry_msg = f"Book {isbn} could not be checked out; please try again."
+    try:
+        with get_cursor(dictionary=False) as cur:
+            cur.execute(_CHECKOUT_SQL, (isbn, card_id, card_id, card_id, isbn))
+
+            if cur.rowcount == 0:
+                # Failure path only: work out which rule blocked the checkout.
+                borrower_exists, active_loans, book_available = _checkout_preflight(
+                    cur, isbn, card_id
+                )
+                if not borrower_exists:
+                    return False, f"Borrower with Card_id {card_id} does not exist."
+                if active_loans >= MAX_ACTIVE_LOANS_PER_BORROWER:
+                    return False, f"Borrower already has {active_loans} active loans."
+                if not book_available:
+                    return False, f"Book {isbn} is currently checked out."
+                return False, retry_msg
+    except DatabaseError as e:
+        if e.errno == errorcode.ER_LOCK_DEADLOCK:
+            return False, retry_msg
+        raise
 
     return True, f"Book {isbn} successfully checked out to borrower {card_id}."
 
@@ -196,28 +315,8 @@ def checkin_book(loan_id: int) -> Tuple[bool, str]:
 
     Returns (success, message).
     """
-    # Ensure there is an active loan to close
-    with get_cursor() as cur:
-        cur.execute(
-            """
-            SELECT Loan_id, Isbn, Card_id, Due_date, Date_in
-            FROM BOOK_LOANS
-            WHERE Loan_id = %s
-            """,
-            (loan_id,),
-        )
-        row = cur.fetchone()
-
-    if row is None:
-        return False, f"No loan found with Loan_id={loan_id}."
-
-    loan = utils.row_to_book_loan(row)
-    if loan.date_in is not None:
-        return False, f"Loan {loan_id} is already closed."
-
-    # Mark as returned and compute/update fines
-    with get_cursor(commit=True) as cur:
-        # 1) Set Date_in = CURDATE()
+    with transaction(dictionary=False) as (_, cur):
+        # 1) Close the loan; only an active loan matches.
         cur.execute(
             """
             UPDATE BOOK_LOANS
@@ -227,38 +326,39 @@ def checkin_book(loan_id: int) -> Tuple[bool, str]:
             (loan_id,),
         )
 
-        # 2) Compute days late and fine
+        if cur.rowcount == 0:
+            # Failure path only: tell "no such loan" apart from "already closed".
+            cur.execute(
+                "SELECT Date_in FROM BOOK_LOANS WHERE Loan_id = %s",
+                (loan_id,),
+            )
+            if cur.fetchone() is None:
+                return False, f"No loan found with Loan_id={loan_id}."
+            return False, f"Loan {loan_id} is already closed."
+
+        # 2) Compute and upsert the fine in SQL; nothing is written if on time.
+        cur.execute(_FINE_SQL, (loan_id,))
+
+        # 3) Read back the figures for the message. rowcount cannot tell us
+        # whether the return was late: without CLIENT_FOUND_ROWS an upsert
+        # that leaves an existing fine unchanged reports 0 rows.
         cur.execute(
             """
-            SELECT
-                DATEDIFF(CURDATE(), Due_date) AS days_late
-            FROM BOOK_LOANS
-            WHERE Loan_id = %s
+            SELECT DATEDIFF(bl.Date_in, bl.Due_date) AS days_late, f.Fine_amt
+            FROM BOOK_LOANS bl
+            LEFT JOIN FINES f ON f.Loan_id = bl.Loan_id
+            WHERE bl.Loan_id = %s
             """,
             (loan_id,),
         )
-        late_row = cur.fetchone()
-        days_late = int((late_row or {}).get("days_late", 0))
+        days_late, fine_amt = cur.fetchone()
 
         if days_late > 0:
-            fine_amt = days_late * FINE_RATE_PER_DAY
-            # Upsert into FINES
-            cur.execute(
-                """
-                INSERT INTO FINES (Loan_id, Fine_amt, Paid)
-                VALUES (%s, %s, 0)
-                ON DUPLICATE KEY UPDATE
-                    Fine_amt = VALUES(Fine_amt),
-                    Paid = 0
-                """,
-                (loan_id, fine_amt),
-            )
             msg = (
                 f"Book returned. Loan {loan_id} is {days_late} days late. "
                 f"Fine applied: ${fine_amt:.2f}."
             )
         else:
-            # If not late, ensure no fine exists or is cleared (optional)
             msg = f"Book returned on time for loan {loan_id}. No fine applied."
 
     return True, msg
@@ -268,6 +368,23 @@ def checkin_book(loan_id: int) -> Tuple[bool, str]:
 # Public: Borrower views
 # ---------------------------------------------------------------------------
 
+_BORROWER_LOAN_HISTORY_SQL = """
+    SELECT bl.*, b.Title, (bl.Date_in IS NULL) AS is_active
+    FROM BOOK_LOANS bl
+    JOIN BOOK b ON b.Isbn = bl.Isbn
+    WHERE bl.Card_id = %s
+    ORDER BY bl.Date_out DESC, bl.Loan_id DESC
+"""
+
+_BORROWER_ACTIVE_LOANS_SQL = """
+    SELECT bl.*, b.Title, (bl.Date_in IS NULL) AS is_active
+    FROM BOOK_LOANS bl
+    JOIN BOOK b ON b.Isbn = bl.Isbn
+    WHERE bl.Card_id = %s AND bl.Date_in IS NULL
+    ORDER BY bl.Date_out DESC, bl.Loan_id DESC
+"""
+
+
 def get_borrower_loans(card_id: str, include_history: bool = False) -> List[Dict[str, Any]]:
     """
     Return current (and optionally historical) loans for a borrower.
@@ -277,46 +394,43 @@ def get_borrower_loans(card_id: str, include_history: bool = False) -> List[Dict
         - book_title
         - is_active (bool)
     """
-    if not _borrower_exists(card_id):
-        return []
-
+    sql = _BORROWER_LOAN_HISTORY_SQL if include_history else _BORROWER_ACTIVE_LOANS_SQL
     with get_cursor() as cur:
-        if include_history:
-            cur.execute(
-                """
-                SELECT bl.*, b.Title
-                FROM BOOK_LOANS bl
-                JOIN BOOK b ON b.Isbn = bl.Isbn
-                WHERE bl.Card_id = %s
-                ORDER BY bl.Date_out DESC, bl.Loan_id DESC
-                """,
-                (card_id,),
-            )
-        else:
-            cur.execute(
-                """
-                SELECT bl.*, b.Title
-                FROM BOOK_LOANS bl
-                JOIN BOOK b ON b.Isbn = bl.Isbn
-                WHERE bl.Card_id = %s AND bl.Date_in IS NULL
-                ORDER BY bl.Date_out DESC, bl.Loan_id DESC
-                """,
-                (card_id,),
-            )
-        rows = cur.fetchall()
-
-    results: List[Dict[str, Any]] = []
-    for row in rows:
-        loan = utils.row_to_book_loan(row)
-        is_active = loan.date_in is None
-        results.append(
-            {
-                "loan": asdict(loan),
-                "book_title": row.get("Title"),
-                "is_active": is_active,
-            }
-        )
-    return results
+        cur.execute(sql, (card_id,))
+        return _loan_items(iter_rows(cur))
+
+
+def _loan_items(rows) -> List[Dict[str, Any]]:
+    # Build the loan dicts straight from the rows; going through BookLoan
+    # and back to a dict would allocate a model per row for nothing.
+    return [
+        {
+            "loan": {
+                "loan_id": int(row["Loan_id"]),
+                "isbn": row["Isbn"],
+                "card_id": row["Card_id"],
+                "date_out": row["Date_out"],
+                "due_date": row["Due_date"],
+                "date_in": row["Date_in"],
+            },
+            "book_title": row.get("Title"),
+            "is_active": bool(row["is_active"]),
+        }
+        for row in rows
+    ]
+
+
+# One statement for both cases (the second parameter is the only_unpaid
+# flag), so the dashboard query below can reuse it as-is.
+_BORROWER_FINES_SQL = """
+    SELECT f.*, bl.Isbn, bl.Date_out, bl.Due_date, bl.Date_in, b.Title
+    FROM FINES f
+    JOIN BOOK_LOANS bl ON bl.Loan_id = f.Loan_id
+    JOIN BOOK b ON b.Isbn = bl.Isbn
+    WHERE bl.Card_id = %s
+      AND (f.Paid = 0 OR %s = 0)
+    ORDER BY bl.Due_date DESC
+"""
 
 
 def get_borrower_fines(card_id: str, only_unpaid: bool = True) -> List[Dict[str, Any]]:
@@ -328,41 +442,27 @@ def get_borrower_fines(card_id: str, only_unpaid: bool = True) -> List[Dict[str,
         - book_title
         - date_out, due_date, date_in
     """
-    if not _borrower_exists(card_id):
-        return []
-
     with get_cursor() as cur:
-        cur.execute(
-            f"""
-            SELECT f.*, bl.Isbn, bl.Date_out, bl.Due_date, bl.Date_in, b.Title
-            FROM FINES f
-            JOIN BOOK_LOANS bl ON bl.Loan_id = f.Loan_id
-            JOIN BOOK b ON b.Isbn = bl.Isbn
-            WHERE bl.Card_id = %s
-              {"AND f.Paid = 0" if only_unpaid else ""}
-            ORDER BY bl.Due_date DESC
-            """,
-            (card_id,),
-        )
-        rows = cur.fetchall()
-
-    results: List[Dict[str, Any]] = []
-    for row in rows:
-        fine = Fine(
-            loan_id=int(row["Loan_id"]),
-            fine_amt=float(row["Fine_amt"]),
-            paid=utils.to_bool(row["Paid"]),
-        )
-        results.append(
-            {
-                "fine": asdict(fine),
-                "book_title": row.get("Title"),
-                "date_out": str(row.get("Date_out")),
-                "due_date": str(row.get("Due_date")),
-                "date_in": str(row.get("Date_in")) if row.get("Date_in") else None,
-            }
-        )
-    return results
+        cur.execute(_BORROWER_FINES_SQL, (card_id, int(only_unpaid)))
+        return _fine_items(iter_rows(cur))
+
+
+def _fine_items(rows) -> List[Dict[str, Any]]:
+    to_bool = utils.to_bool  # hoisted out of the per-row loop
+    return [
+        {
+            "fine": {
+                "loan_id": int(row["Loan_id"]),
+                "fine_amt": float(row["Fine_amt"]),
+                "paid": to_bool(row["Paid"]),
+            },
+            "book_title": row.get("Title"),
+            "date_out": row["Date_out"],
+            "due_date": row["Due_date"],
+            "date_in": row["Date_in"],
+        }
+        for row in rows
+    ]
 
 
 def pay_fine(loan_id: int) -> Tuple[bool, str]:
@@ -371,10 +471,10 @@ def pay_fine(loan_id: int) -> Tuple[bool, str]:
 
     Returns (success, message).
     """
-    with get_cursor(commit=True) as cur:
-        # Check existing fine
+    with transaction(dictionary=False) as (_, cur):
+        # Check existing fine (locked until the transaction commits)
         cur.execute(
-            "SELECT Loan_id, Fine_amt, Paid FROM FINES WHERE Loan_id = %s",
+            "SELECT Paid FROM FINES WHERE Loan_id = %s FOR UPDATE",
             (loan_id,),
         )
         row = cur.fetchone()
@@ -382,7 +482,8 @@ def pay_fine(loan_id: int) -> Tuple[bool, str]:
         if row is None:
             return False, f"No fine found for loan {loan_id}."
 
-        if utils.to_bool(row.get("Paid")):
+        (paid,) = row
+        if utils.to_bool(paid):
             return False, f"Fine for loan {loan_id} is already marked as paid."
 
         cur.execute(
@@ -397,21 +498,25 @@ def pay_fine(loan_id: int) -> Tuple[bool, str]:
 # Convenience: simple borrower lookup (for CLI etc.)
 # ---------------------------------------------------------------------------
 
+_BORROWER_SQL = """
+    SELECT *
+    FROM BORROWER
+    WHERE Card_id = %s
+"""
+
+
 def get_borrower(card_id: str) -> Optional[Dict[str, Any]]:
     """
     Fetch a single borrower by card_id as a dict, or None if not found.
     """
     with get_cursor() as cur:
-        cur.execute(
-            """
-            SELECT *
-            FROM BORROWER
-            WHERE Card_id = %s
-            """,
-            (card_id,),
-        )
+        cur.execute(_BORROWER_SQL, (card_id,))
         row = cur.fetchone()
 
+    return _borrower_dict(row)
+
+
+def _borrower_dict(row: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     if not row:
         return None
 
@@ -422,4 +527,38 @@ def get_borrower(card_id: str) -> Optional[Dict[str, Any]]:
         address=row["Address"],
         phone=row.get("Phone"),
     )
-    return asdict(borrower)
+    return utils.model_to_dict(borrower)
+
+
+# The borrower, full loan history and all fines, sent as one multi-statement
+# query (text protocol; prepared statements cannot hold several statements).
+_BORROWER_DASHBOARD_SQL = ";".join(
+    (_BORROWER_SQL, _BORROWER_LOAN_HISTORY_SQL, _BORROWER_FINES_SQL)
+)
+
+
+def get_borrower_dashboard(
+    card_id: str,
+) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Return (borrower, loans, fines) for the borrower page in one round trip.
+
+    Same results as get_borrower(card_id),
+    get_borrower_loans(card_id, include_history=True) and
+    get_borrower_fines(card_id, only_unpaid=False), but all three queries go
+    to the server together and their result sets are read with nextset().
+    If the borrower does not exist, returns (None, [], []).
+    """
+    with get_cursor() as cur:
+        # The trailing 0 is the fines query's only_unpaid flag.
+        cur.execute(_BORROWER_DASHBOARD_SQL, (card_id, card_id, card_id, 0))
+        borrower = _borrower_dict(cur.fetchone())
+        cur.fetchall()  # drain; Card_id is the primary key
+        cur.nextset()
+        loans = _loan_items(iter_rows(cur))
+        cur.nextset()
+        fines = _fine_items(iter_rows(cur))
+
+    if borrower is None:
+        return None, [], []
+    return borrower, loans, fines
@@ -91,12 +91,15 @@ def action_checkin_book() -> None:
 
 def action_view_borrower_loans() -> None:
     card_id = input("Enter borrower Card_id: ").strip()
+    if library_service.get_borrower(card_id) is None:
+        print("No borrower found.")
+        return
     include_history = input("Include history? (y/N): ").strip().lower() == "y"
 
     loans = library_service.get_borrower_loans(card_id, include_history=include_history)
     _print_header(f"Loans for borrower {card_id}")
     if not loans:
-        print("No loans found (or borrower may not exist).")
+        print("No loans found.")
         return
 
     for entry in loans:
@@ -113,6 +116,9 @@ def action_view_borrower_loans() -> None:
 
 def action_view_borrower_fines() -> None:
     card_id = input("Enter borrower Card_id: ").strip()
+    if library_service.get_borrower(card_id) is None:
+        print("No borrower found.")
+        return
     only_unpaid = input("Only unpaid fines? (Y/n): ").strip().lower() != "n"
 
     fines = library_service.get_borrower_fines(card_id, only_unpaid=only_unpaid)
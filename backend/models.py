@@ -11,9 +11,15 @@ schema/schema.sql (MySQL):
   - BORROWER
   - BOOK_LOANS
   - FINES
+
+All models are slotted dataclasses (no per-instance __dict__), since the
+row converters create one per result row. They are deliberately not
+frozen: a frozen dataclass's __init__ goes through object.__setattr__
+for every field, which makes building each row noticeably slower.
 """
 
 from dataclasses import dataclass
+from datetime import date
 from typing import Optional
 
 
@@ -21,21 +27,21 @@ from typing import Optional
 # Core entities
 # -----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Book:
     """Mirrors the BOOK table."""
     isbn: str
     title: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Author:
     """Mirrors the AUTHORS table."""
     author_id: int
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BookAuthor:
     """
     Mirrors the BOOK_AUTHORS link table (many-to-many between BOOK and AUTHORS).
@@ -44,7 +50,7 @@ class BookAuthor:
     author_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Borrower:
     """Mirrors the BORROWER table."""
     card_id: str
@@ -55,20 +61,21 @@ class Borrower:
     phone: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class BookLoan:
     """Mirrors the BOOK_LOANS table."""
     loan_id: int
     isbn: str
     card_id: str
-    # Dates are stored as DATE in MySQL; represented as strings or date objects in code.
-    date_out: str
-    due_date: str
+    # Dates are stored as DATE in MySQL and kept as datetime.date in code;
+    # format them at the edge (templates, CLI) rather than per row.
+    date_out: date
+    due_date: date
     # NULL for active loans
-    date_in: Optional[str] = None
+    date_in: Optional[date] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Fine:
     """Mirrors the FINES table."""
     loan_id: int
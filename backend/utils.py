@@ -13,9 +13,10 @@ repeating row→model conversion everywhere.
 
 from __future__ import annotations
 
-from dataclasses import asdict
+from dataclasses import fields, is_dataclass
 from datetime import date, datetime
-from typing import Any, Mapping, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from .models import Book, Author, BookAuthor, Borrower, BookLoan, Fine
 
@@ -24,20 +25,27 @@ from .models import Book, Author, BookAuthor, Borrower, BookLoan, Fine
 # Generic helpers
 # ---------------------------------------------------------------------------
 
+_FALSY_STRS = frozenset({"0", "", "false", "False", "FALSE"})
+
+
 def to_bool(value: Any) -> bool:
     """
     Convert typical MySQL boolean-ish values to a Python bool.
 
     Accepts 0/1, '0'/'1', True/False, or anything truthy/falsy.
     """
-    if isinstance(value, bool):
+    # Exact type checks for the numeric types the driver returns; they skip
+    # the MRO walk isinstance() does, and subclasses fall through to bool().
+    # Strings (including str subclasses) are matched with one isinstance().
+    t = type(value)
+    if t is bool:
         return value
+    if t is int or t is float:
+        return value != 0
     if value is None:
         return False
-    if isinstance(value, (int, float)):
-        return value != 0
     if isinstance(value, str):
-        return value.strip() not in ("0", "", "false", "False", "FALSE")
+        return value.strip() not in _FALSY_STRS
     return bool(value)
 
 
@@ -49,29 +57,53 @@ def parse_date(value: Any) -> Optional[date]:
       - None
       - datetime.date
       - datetime.datetime
-      - ISO-8601 strings (e.g. '2025-01-20')
+      - ISO-8601 strings (e.g. '2025-01-20'), as str or bytes
     """
+    # Exact-type checks first. Both the C and pure-Python drivers return
+    # datetime.date for DATE columns; str is for non-driver input (form
+    # fields, CSV rows, the CLI).
+    t = type(value)
+    if t is date:
+        return value
+    if t is str:
+        return _parse_iso_date_str(value)
     if value is None:
         return None
     if isinstance(value, date) and not isinstance(value, datetime):
         return value
     if isinstance(value, datetime):
         return value.date()
-    # Fallback: assume string in ISO format
-    return date.fromisoformat(str(value))
+    # Drivers returning raw column bytes (e.g. use_unicode=False); str()
+    # would give "b'2025-01-20'".
+    if isinstance(value, (bytes, bytearray)):
+        return _parse_iso_date_str(value.decode("ascii"))
+    # Fallback: assume something whose str() is in ISO format
+    return _parse_iso_date_str(str(value))
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_date_str(s: str) -> date:
+    """
+    Parse a 'YYYY-MM-DD' string, memoized.
+
+    Loan tables repeat the same few dates across many rows (Date_out,
+    Due_date, Date_in), so most calls are cache hits.
+    """
+    return date.fromisoformat(s)
 
 
 def date_to_str(d: Optional[date]) -> Optional[str]:
     """Convert a date to 'YYYY-MM-DD' string or return None."""
-    if d is None:
-        return None
-    return d.isoformat()
+    return None if d is None else d.isoformat()
 
 
 # ---------------------------------------------------------------------------
 # Row → model converters
 # ---------------------------------------------------------------------------
 
+_SENTINEL = object()
+
+
 def _get(row: Mapping[str, Any], *keys: str) -> Any:
     """
     Helper to get a field from a row using possible alternative keys.
@@ -81,75 +113,166 @@ def _get(row: Mapping[str, Any], *keys: str) -> Any:
 
     This is useful because MySQL column names are often `Isbn`, `Title`, etc.,
     but queries might alias them to lower_snake_case.
+
+    The first key is the usual one, so it costs a single dict lookup; the
+    alternatives are only probed by _get_slow() when it is missing.
     """
-    for k in keys:
-        if k in row:
-            return row[k]
+    v = row.get(keys[0], _SENTINEL)
+    return v if v is not _SENTINEL else _get_slow(row, keys)
+
+
+def _get_slow(row: Mapping[str, Any], keys: Tuple[str, ...]) -> Any:
+    for k in keys[1:]:
+        v = row.get(k, _SENTINEL)
+        if v is not _SENTINEL:
+            return v
     raise KeyError(f"None of keys {keys} found in row: {row!r}")
 
 
+# Each converter first tries the raw MySQL column names (what SELECT * and
+# dictionary cursors return) with plain subscripts, and only falls back to
+# probing alternative keys via _get() when one of them is missing.
+#
+# The model classes are referenced as plain globals on purpose: CPython
+# 3.11+ caches module-global lookups inline, and binding them as default
+# arguments (the usual LOAD_FAST trick) measured slower, not faster.
+
 def row_to_book(row: Mapping[str, Any]) -> Book:
-    return Book(
-        isbn=_get(row, "Isbn", "isbn"),
-        title=_get(row, "Title", "title"),
-    )
+    try:
+        return Book(isbn=row["Isbn"], title=row["Title"])
+    except KeyError:
+        return Book(
+            isbn=_get(row, "Isbn", "isbn"),
+            title=_get(row, "Title", "title"),
+        )
 
 
 def row_to_author(row: Mapping[str, Any]) -> Author:
-    return Author(
-        author_id=int(_get(row, "Author_id", "author_id", "id")),
-        name=_get(row, "Name", "name"),
-    )
+    try:
+        return Author(author_id=int(row["Author_id"]), name=row["Name"])
+    except KeyError:
+        return Author(
+            author_id=int(_get(row, "Author_id", "author_id", "id")),
+            name=_get(row, "Name", "name"),
+        )
 
 
 def row_to_book_author(row: Mapping[str, Any]) -> BookAuthor:
-    return BookAuthor(
-        isbn=_get(row, "Isbn", "isbn"),
-        author_id=int(_get(row, "Author_id", "author_id")),
-    )
+    try:
+        return BookAuthor(isbn=row["Isbn"], author_id=int(row["Author_id"]))
+    except KeyError:
+        return BookAuthor(
+            isbn=_get(row, "Isbn", "isbn"),
+            author_id=int(_get(row, "Author_id", "author_id")),
+        )
 
 
 def row_to_borrower(row: Mapping[str, Any]) -> Borrower:
-    return Borrower(
-        card_id=_get(row, "Card_id", "card_id"),
-        ssn=_get(row, "Ssn", "ssn"),
-        bname=_get(row, "Bname", "bname", "name"),
-        address=_get(row, "Address", "address"),
-        phone=_get(row, "Phone", "phone"),
-    )
+    try:
+        return Borrower(
+            card_id=row["Card_id"],
+            ssn=row["Ssn"],
+            bname=row["Bname"],
+            address=row["Address"],
+            phone=row["Phone"],
+        )
+    except KeyError:
+        return Borrower(
+            card_id=_get(row, "Card_id", "card_id"),
+            ssn=_get(row, "Ssn", "ssn"),
+            bname=_get(row, "Bname", "bname", "name"),
+            address=_get(row, "Address", "address"),
+            phone=_get(row, "Phone", "phone"),
+        )
 
 
 def row_to_book_loan(row: Mapping[str, Any]) -> BookLoan:
-    return BookLoan(
-        loan_id=int(_get(row, "Loan_id", "loan_id", "id")),
-        isbn=_get(row, "Isbn", "isbn"),
-        card_id=_get(row, "Card_id", "card_id"),
-        date_out=str(_get(row, "Date_out", "date_out")),
-        due_date=str(_get(row, "Due_date", "due_date")),
-        date_in=_get(row, "Date_in", "date_in"),
-    )
+    try:
+        return BookLoan(
+            loan_id=int(row["Loan_id"]),
+            isbn=row["Isbn"],
+            card_id=row["Card_id"],
+            date_out=row["Date_out"],
+            due_date=row["Due_date"],
+            date_in=row["Date_in"],
+        )
+    except KeyError:
+        return BookLoan(
+            loan_id=int(_get(row, "Loan_id", "loan_id", "id")),
+            isbn=_get(row, "Isbn", "isbn"),
+            card_id=_get(row, "Card_id", "card_id"),
+            date_out=_get(row, "Date_out", "date_out"),
+            due_date=_get(row, "Due_date", "due_date"),
+            date_in=_get(row, "Date_in", "date_in"),
+        )
 
 
 def row_to_fine(row: Mapping[str, Any]) -> Fine:
-    return Fine(
-        loan_id=int(_get(row, "Loan_id", "loan_id")),
-        fine_amt=float(_get(row, "Fine_amt", "fine_amt")),
-        paid=to_bool(_get(row, "Paid", "paid")),
-    )
+    try:
+        return Fine(
+            loan_id=int(row["Loan_id"]),
+            fine_amt=float(row["Fine_amt"]),
+            paid=to_bool(row["Paid"]),
+        )
+    except KeyError:
+        return Fine(
+            loan_id=int(_get(row, "Loan_id", "loan_id")),
+            fine_amt=float(_get(row, "Fine_amt", "fine_amt")),
+            paid=to_bool(_get(row, "Paid", "paid")),
+        )
+
+
+_ROW_CONVERTERS = {
+    "book": row_to_book,
+    "author": row_to_author,
+    "book_author": row_to_book_author,
+    "borrower": row_to_borrower,
+    "book_loan": row_to_book_loan,
+    "fine": row_to_fine,
+}
+
+
+def convert_rows(rows: Iterable[Mapping[str, Any]], kind: str) -> List[Any]:
+    """
+    Convert a whole result set to models in one call.
+
+    `kind` names the model ("book", "author", "book_author", "borrower",
+    "book_loan", "fine"). The converter is looked up once for the batch
+    rather than once per row.
+
+    Example:
+        books = convert_rows(cur.fetchall(), "book")
+    """
+    try:
+        convert = _ROW_CONVERTERS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown row kind: {kind!r}") from None
+    return [convert(row) for row in rows]
 
 
 # ---------------------------------------------------------------------------
 # Small helpers that might be handy for CLI / debugging
 # ---------------------------------------------------------------------------
 
+# Field names per dataclass, filled in on first use by model_to_dict().
+_FIELDS_CACHE: Dict[type, Tuple[str, ...]] = {}
+
+
 def model_to_dict(obj: Any) -> dict:
     """
     Convert a dataclass model to a plain dict.
 
     This is convenient for JSON, pretty-printing, or templating.
+
+    The models are flat (scalar fields only), so a shallow copy of the
+    fields gives the same result as dataclasses.asdict() without its
+    recursive deep copy.
     """
-    try:
-        return asdict(obj)
-    except TypeError:
-        # Not a dataclass; fall back to __dict__ if available
-        return getattr(obj, "__dict__", dict())
+    cls = type(obj)
+    names = _FIELDS_CACHE.get(cls)
+    if names is None:
+        if not is_dataclass(cls):
+            # Not a dataclass; fall back to __dict__ if available
+            return getattr(obj, "__dict__", dict())
+        names = _FIELDS_CACHE[cls] = tuple(f.name for f in fields(cls))
+    return {name: getattr(obj, name) for name in names}
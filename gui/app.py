@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import os
+import re
+import time
+from functools import lru_cache
 from typing import Optional
 
 from flask import Flask, render_template, request, redirect, url_for, flash
@@ -9,6 +13,38 @@ from backend import library_service
 app = Flask(__name__)
 app.secret_key = "dev-secret-key"  # for flash messages; in real app, use env
 
+# Templates do not change while the app runs, so skip the per-render
+# mtime check and compile them once up front into the Jinja cache.
+app.config["TEMPLATES_AUTO_RELOAD"] = False
+app.jinja_env.auto_reload = False
+for _template in ("base.html", "search.html", "borrower.html"):
+    app.jinja_env.get_template(_template)
+
+
+# Shapes of the keys stored in schema.sql (BOOK.Isbn is a 10-character
+# ISBN-10, BORROWER.Card_id is VARCHAR(20)); anything else is rejected
+# before it reaches the database.
+_ISBN_RE = re.compile(r"^[0-9]{9}[0-9Xx]$").match
+_CARD_RE = re.compile(r"^[A-Za-z0-9]{1,20}$").match
+
+
+def _form(*names: str) -> tuple:
+    """Return the stripped values of the given form fields ('' if missing)."""
+    form = request.form  # resolve the request proxy once
+    return tuple(form.get(name, "").strip() for name in names)
+
+
+@lru_cache(maxsize=1024)
+def _borrower_url(card_id: str) -> str:
+    """
+    URL of the borrower dashboard for card_id, memoized.
+
+    Every borrower POST handler redirects here, so cache the URL map
+    reverse lookup. Must be called inside a request (url_for needs one);
+    the result only depends on card_id since relative URLs are built.
+    """
+    return url_for("borrower", card_id=card_id)
+
 
 @app.route("/")
 def index():
@@ -19,27 +55,51 @@ def index():
 # Book search + checkout
 # ----------------------------
 
+# Queries shorter than this are not sent to the database at all.
+MIN_SEARCH_LEN = 2
+
+# How long a cached search result may be served (seconds). Checkouts and
+# checkins made through this app clear the cache immediately.
+SEARCH_CACHE_TTL = 30
+
+
+@lru_cache(maxsize=256)
+def _cached_search(query: str, time_bucket: int):
+    # time_bucket changes every SEARCH_CACHE_TTL seconds, so old entries
+    # stop being hit and simply age out of the LRU.
+    return library_service.search_books(query)
+
+
+def _search(query: str):
+    return _cached_search(query, int(time.monotonic() // SEARCH_CACHE_TTL))
+
+
 @app.route("/search", methods=["GET", "POST"])
 def search():
     query = request.args.get("q", "").strip()
     results = []
 
-    if query:
-        results = library_service.search_books(query)
+    if len(query) >= MIN_SEARCH_LEN:
+        results = _search(query)
 
     return render_template("search.html", query=query, results=results)
 
 
 @app.route("/checkout", methods=["POST"])
 def checkout():
-    isbn = request.form.get("isbn", "").strip()
-    card_id = request.form.get("card_id", "").strip()
+    isbn, card_id = _form("isbn", "card_id")
 
     if not isbn or not card_id:
         flash("ISBN and Card ID are required for checkout.", "error")
         return redirect(url_for("search", q=isbn))
 
+    if not _ISBN_RE(isbn) or not _CARD_RE(card_id):
+        flash("Invalid ISBN or Card ID.", "error")
+        return redirect(url_for("search", q=isbn))
+
     success, msg = library_service.checkout_book(isbn, card_id)
+    if success:
+        _cached_search.cache_clear()  # availability changed
     flash(msg, "success" if success else "error")
     return redirect(url_for("search", q=isbn))
 
@@ -56,14 +116,14 @@ def borrower():
     fines = []
 
     if request.method == "POST":
-        card_id = request.form.get("card_id", "").strip()
-        return redirect(url_for("borrower", card_id=card_id))
+        (card_id,) = _form("card_id")
+        return redirect(_borrower_url(card_id))
 
     card_id = request.args.get("card_id", "").strip()
-    if card_id:
-        borrower = library_service.get_borrower(card_id)
-        loans = library_service.get_borrower_loans(card_id, include_history=True)
-        fines = library_service.get_borrower_fines(card_id, only_unpaid=False)
+    if card_id and not _CARD_RE(card_id):
+        flash("Invalid Card ID.", "error")
+    elif card_id:
+        borrower, loans, fines = library_service.get_borrower_dashboard(card_id)
 
     return render_template(
         "borrower.html",
@@ -76,32 +136,36 @@ def borrower():
 
 @app.route("/checkin", methods=["POST"])
 def checkin():
-    loan_id = request.form.get("loan_id", "").strip()
-    card_id = request.form.get("card_id", "").strip()
+    loan_id, card_id = _form("loan_id", "card_id")
 
     if not loan_id.isdigit():
         flash("Loan ID must be an integer.", "error")
-        return redirect(url_for("borrower", card_id=card_id))
+        return redirect(_borrower_url(card_id))
 
     success, msg = library_service.checkin_book(int(loan_id))
+    if success:
+        _cached_search.cache_clear()  # availability changed
     flash(msg, "success" if success else "error")
-    return redirect(url_for("borrower", card_id=card_id))
+    return redirect(_borrower_url(card_id))
 
 
 @app.route("/pay_fine", methods=["POST"])
 def pay_fine():
-    loan_id = request.form.get("loan_id", "").strip()
-    card_id = request.form.get("card_id", "").strip()
+    loan_id, card_id = _form("loan_id", "card_id")
 
     if not loan_id.isdigit():
         flash("Loan ID must be an integer.", "error")
-        return redirect(url_for("borrower", card_id=card_id))
+        return redirect(_borrower_url(card_id))
 
     success, msg = library_service.pay_fine(int(loan_id))
     flash(msg, "success" if success else "error")
-    return redirect(url_for("borrower", card_id=card_id))
+    return redirect(_borrower_url(card_id))
 
 
 if __name__ == "__main__":
     # Run with: python -m gui.app
-    app.run(debug=True)
+    # (set FLASK_DEBUG=1 for the debugger and template reloading)
+    debug = os.environ.get("FLASK_DEBUG", "") not in ("", "0")
+    if debug:
+        app.jinja_env.auto_reload = True
+    app.run(debug=debug)
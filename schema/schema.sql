@@ -29,6 +29,9 @@ CREATE TABLE BOOK (
 -- Index to help title-based search
 CREATE INDEX idx_book_title ON BOOK (Title);
 
+-- Word-level index used by MATCH ... AGAINST in search_books()
+CREATE FULLTEXT INDEX ft_book_title ON BOOK (Title);
+
 -- ===========================================
 -- AUTHORS: unique authors
 -- ===========================================
@@ -41,6 +44,9 @@ CREATE TABLE AUTHORS (
 -- Index to help author-name search
 CREATE INDEX idx_authors_name ON AUTHORS (Name);
 
+-- Word-level index used by MATCH ... AGAINST in search_books()
+CREATE FULLTEXT INDEX ft_authors_name ON AUTHORS (Name);
+
 -- ===========================================
 -- BOOK_AUTHORS: M:N relationship between books and authors
 -- ===========================================
@@ -81,8 +87,10 @@ CREATE TABLE BOOK_LOANS (
     Due_date    DATE         NOT NULL,
     Date_in     DATE         DEFAULT NULL,
     PRIMARY KEY (Loan_id),
-    KEY idx_loans_isbn (Isbn),
-    KEY idx_loans_card (Card_id),
+    -- (x, Date_in) lets "active loans for this book/borrower" checks
+    -- (Date_in IS NULL) be answered from the index alone
+    KEY idx_loans_isbn_active (Isbn, Date_in),
+    KEY idx_loans_card_active (Card_id, Date_in),
     CONSTRAINT fk_book_loans_book
         FOREIGN KEY (Isbn) REFERENCES BOOK (Isbn)
         ON UPDATE CASCADE ON DELETE RESTRICT,
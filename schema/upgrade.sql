@@ -0,0 +1,22 @@
+-- Upgrade an existing library database to the indexes in schema.sql.
+--
+-- schema.sql already creates all of these, so a database built with
+-- reset.sql does not need this; run it once on a database created before
+-- they were added:
+--   mysql -u root -p library < schema/upgrade.sql
+
+USE library;
+
+-- FULLTEXT book search: search_books() uses MATCH ... AGAINST, which fails
+-- with error 1191 ("Can't find FULLTEXT index") until these exist.
+ALTER TABLE BOOK ADD FULLTEXT INDEX ft_book_title (Title);
+ALTER TABLE AUTHORS ADD FULLTEXT INDEX ft_authors_name (Name);
+
+-- BOOK_LOANS: replace the single-column keys with (x, Date_in) keys so the
+-- active-loan checks are answered from the index. Added and dropped in one
+-- statement because the old keys back the foreign keys on Isbn / Card_id.
+ALTER TABLE BOOK_LOANS
+    ADD KEY idx_loans_isbn_active (Isbn, Date_in),
+    ADD KEY idx_loans_card_active (Card_id, Date_in),
+    DROP KEY idx_loans_isbn,
+    DROP KEY idx_loans_card;
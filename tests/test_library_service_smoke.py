@@ -16,19 +16,24 @@ NOTE:
 
 from __future__ import annotations
 
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-from backend import library_service
+from backend import db, library_service
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+_BAR = "=" * 60
+
+
 def _print_banner(name: str) -> None:
-    print("\n" + "=" * 60)
-    print(f"[TEST] {name}")
-    print("=" * 60)
+    print(f"\n{_BAR}\n[TEST] {name}\n{_BAR}")
 
 
 def _safe_run(name: str, func) -> None:
@@ -40,6 +45,47 @@ def _safe_run(name: str, func) -> None:
         print(f"[FAILED] {name}: {e}")
 
 
+class _ThreadStdout(io.TextIOBase):
+    """
+    sys.stdout stand-in that sends each thread's writes to that thread's
+    buffer (if it has one), so parallel tests don't interleave their output.
+    """
+
+    def __init__(self, real) -> None:
+        self._real = real
+        self._local = threading.local()
+
+    def capture(self) -> io.StringIO:
+        self._local.buf = io.StringIO()
+        return self._local.buf
+
+    def write(self, s: str) -> int:
+        return getattr(self._local, "buf", self._real).write(s)
+
+
+def _run_parallel(tests, max_workers: int = 4) -> None:
+    """
+    Run independent (read-only) tests concurrently; they mostly wait on
+    MySQL round trips. Each test's output is printed in order once all
+    of them have finished.
+    """
+    out = _ThreadStdout(sys.stdout)
+
+    def run(test) -> str:
+        buf = out.capture()
+        _safe_run(*test)
+        return buf.getvalue()
+
+    sys.stdout = out
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            outputs = list(pool.map(run, tests))
+    finally:
+        sys.stdout = out._real
+    for text in outputs:
+        sys.stdout.write(text)
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -52,6 +98,53 @@ def test_search_books_basic() -> None:
         print("Sample:", results[0])
 
 
+def test_fulltext_terms() -> None:
+    # Words become required prefix matches; words too short for the
+    # FULLTEXT index, InnoDB stopwords and boolean-mode operators are dropped.
+    assert library_service._fulltext_terms("Harry pot") == "+Harry* +pot*"
+    assert library_service._fulltext_terms("of the rings") == "+rings*"
+    assert library_service._fulltext_terms("The Hobbit") == "+Hobbit*"
+    assert library_service._fulltext_terms("the who") == ""
+    assert library_service._fulltext_terms('-evil +"x" (a)') == "+evil*"
+    assert library_service._fulltext_terms("a b") == ""
+    print("_fulltext_terms() builds the expected BOOLEAN MODE strings.")
+
+
+def test_search_books_stopword_title() -> None:
+    # A title that starts with a stopword must still be found when the
+    # stopword is part of the query ("the hobbit" -> "The Hobbit").
+    with db.get_cursor(dictionary=False) as cur:
+        cur.execute(
+            "SELECT Isbn, Title FROM BOOK "
+            "WHERE Title REGEXP '^The [A-Za-z ]+$' LIMIT 1"
+        )
+        row = cur.fetchone()
+        cur.fetchall()
+    if row is None:
+        print("Skipping stopword search test; no 'The ...' title in BOOK.")
+        return
+
+    isbn, title = row
+    query = title.lower()
+    results = library_service.search_books(query)
+    assert any(r["book"]["isbn"] == isbn for r in results), (query, isbn)
+    print(f"search_books({query!r}) found {title!r}.")
+
+
+def test_search_books_like_fallback() -> None:
+    # No word is long enough for the FULLTEXT index, so this goes through
+    # the LIKE substring query instead.
+    term = "of"
+    assert library_service._fulltext_terms(term) == ""
+    results = library_service.search_books(term)
+    assert len(results) <= 50
+    for r in results:
+        title = r["book"]["title"].lower()
+        authors = " ".join(r["authors"]).lower()
+        assert term in title or term in authors or r["book"]["isbn"] == term
+    print(f"search_books({term!r}) (LIKE fallback) returned {len(results)} result(s).")
+
+
 def test_get_borrower_not_found() -> None:
     card_id = "NON_EXISTENT_CARD_ID_12345"
     borrower = library_service.get_borrower(card_id)
@@ -73,6 +166,55 @@ def test_get_borrower_fines_empty() -> None:
     print(f"get_borrower_fines({card_id!r}) returned empty list as expected.")
 
 
+def test_pool_concurrency() -> None:
+    # More simultaneous users than pooled connections: the extra ones must
+    # wait for a free connection instead of failing with "pool exhausted".
+    workers = db.POOL_SIZE * 3
+
+    def hold_connection(_) -> int:
+        with db.get_cursor(dictionary=False) as cur:
+            cur.execute("SELECT SLEEP(0.2)")
+            cur.fetchall()
+        return 1
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        done = sum(pool.map(hold_connection, range(workers)))
+    assert done == workers
+    print(f"{workers} concurrent cursors shared {db.POOL_SIZE} pooled connections.")
+
+
+def test_get_borrower_dashboard_not_found() -> None:
+    card_id = "NON_EXISTENT_CARD_ID_12345"
+    dashboard = library_service.get_borrower_dashboard(card_id)
+    assert dashboard == (None, [], [])
+    print(f"get_borrower_dashboard({card_id!r}) returned (None, [], []) as expected.")
+
+
+def test_get_borrower_dashboard_matches_getters() -> None:
+    # Any existing borrower will do; prefer one with loans so the loan and
+    # fine result sets of the multi-statement query are non-trivial.
+    with db.get_cursor(dictionary=False) as cur:
+        cur.execute(
+            "SELECT Card_id FROM BOOK_LOANS "
+            "UNION ALL SELECT Card_id FROM BORROWER LIMIT 1"
+        )
+        row = cur.fetchone()
+        cur.fetchall()
+    if row is None:
+        print("Skipping dashboard comparison; BORROWER table is empty.")
+        return
+
+    (card_id,) = row
+    borrower, loans, fines = library_service.get_borrower_dashboard(card_id)
+    assert borrower == library_service.get_borrower(card_id)
+    assert loans == library_service.get_borrower_loans(card_id, include_history=True)
+    assert fines == library_service.get_borrower_fines(card_id, only_unpaid=False)
+    print(
+        f"get_borrower_dashboard({card_id!r}) matches the separate getters "
+        f"({len(loans)} loan(s), {len(fines)} fine(s))."
+    )
+
+
 # These tests require REAL data in your DB.
 # Fill in values that you know exist to exercise the full flow.
 
@@ -110,11 +252,22 @@ def test_pay_fine_manual() -> None:
 # ---------------------------------------------------------------------------
 
 def main() -> None:
-    _safe_run("search_books_basic", test_search_books_basic)
-    _safe_run("get_borrower_not_found", test_get_borrower_not_found)
-    _safe_run("get_borrower_loans_empty", test_get_borrower_loans_empty)
-    _safe_run("get_borrower_fines_empty", test_get_borrower_fines_empty)
-
+    _run_parallel([
+        ("search_books_basic", test_search_books_basic),
+        ("fulltext_terms", test_fulltext_terms),
+        ("search_books_stopword_title", test_search_books_stopword_title),
+        ("search_books_like_fallback", test_search_books_like_fallback),
+        ("get_borrower_not_found", test_get_borrower_not_found),
+        ("get_borrower_loans_empty", test_get_borrower_loans_empty),
+        ("get_borrower_fines_empty", test_get_borrower_fines_empty),
+        ("get_borrower_dashboard_not_found", test_get_borrower_dashboard_not_found),
+        ("get_borrower_dashboard_matches_getters", test_get_borrower_dashboard_matches_getters),
+    ])
+
+    # Uses its own threads to exhaust the pool, so it runs on its own.
+    _safe_run("pool_concurrency", test_pool_concurrency)
+
+    # These change data, so keep them serial and in this order.
     _safe_run("checkout_book_manual", test_checkout_book_manual)
     _safe_run("checkin_book_manual", test_checkin_book_manual)
     _safe_run("pay_fine_manual", test_pay_fine_manual)